@@ -12,6 +12,18 @@ from simulations import pendulum
 # 1. Page Config
 st.set_page_config(page_title="Stochastic Physics", layout="wide")
 
+# --- CACHED ENGINE CALLS ---
+# Streamlit reruns the whole script on every interaction. The engines are pure
+# functions of their arguments, so revisiting a viewport costs nothing.
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_mandelbrot(xmin, xmax, ymin, ymax, w, h, max_iter):
+    return fractal.generate_mandelbrot(xmin, xmax, ymin, ymax, w, h, max_iter)
+
+# Seeded, so a given parameter set always maps to the same chain
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_polymer(N, step_size, solvent, use_saw, seed):
+    return polymer.generate_polymer(N, step_size, solvent, use_saw, seed)
+
 # 2. Sidebar Navigation
 st.sidebar.title("Physics Dashboard")
 app_mode = st.sidebar.selectbox("Choose Simulation", 
@@ -48,20 +60,16 @@ if app_mode == "Mandelbrot Explorer":
     if st.button("Generate Fractal"):
         with st.spinner("Computing chaos..."):
             # 1. Run the Engine
-            img = fractal.generate_mandelbrot(xmin, xmax, ymin, ymax, w, h, max_iter)
+            # Round the viewport so floating-point noise doesn't create new cache entries
+            view = tuple(round(v, 8) for v in (xmin, xmax, ymin, ymax))
+            img = cached_mandelbrot(*view, w, h, max_iter)
             
             # --- NEW DISPLAY LOGIC ---
             
             # 2. Color Mapping (Manual)
             # We map the raw iteration counts (integers) to colors (RGBA) directly.
             # This bypasses Matplotlib's "Figure" overhead.
-            
-            # Normalize to 0.0 - 1.0
-            norm_img = img / max_iter 
-            
-            # Apply the colormap (returns a [Width, Height, 4] array)
-            cmap = plt.get_cmap('hot')
-            colored_img = cmap(norm_img)
+            colored_img = fractal.colorize(img, max_iter, 'hot')
             
             # 3. Display raw pixels
             # 'use_column_width=False' ensures it doesn't get squished.
@@ -195,6 +203,8 @@ elif app_mode == "Polymer Simulator":
             "Good Solvent (Swollen)", 
             "Bad Solvent (Collapsed)"
         ])
+        seed = st.number_input("Seed", min_value=0, value=0, step=1,
+                               help="The same seed and parameters always reproduce the same chain")
         
     # Automatically derive the physical constraints from the solvent quality selection
     use_saw = "Good Solvent" in solvent
@@ -203,10 +213,11 @@ elif app_mode == "Polymer Simulator":
     if st.button("Synthesize Polymer"):
         with st.spinner("Simulating molecular dynamics..."):
             # 1. Generate Raw Data
-            x, y, z = polymer.generate_polymer(N, step_size, solvent, use_saw)
+            coords = cached_polymer(N, step_size, solvent, use_saw, seed)
+            x, y, z = coords.T
             
             # 2. Physics Analysis (Standard Metrics)
-            metrics = polymer.analyze_chain(x, y, z)
+            metrics = polymer.analyze_chain(coords)
             
             # Unpack the dictionary for easier use
             r_end = metrics["end_to_end"]
@@ -235,8 +246,15 @@ elif app_mode == "Polymer Simulator":
             fig = plt.figure(figsize=(10, 8))
             ax = fig.add_subplot(111, projection='3d')
             
-            ax.scatter(x, y, z, c=np.arange(N), cmap='cool', s=2, alpha=0.6)
-            ax.plot(x, y, z, alpha=0.2, color='white', lw=0.5)
+            # Matplotlib's 3D projector is the slow part for long chains, so draw
+            # at most ~2000 points (start, end and CoM markers stay exact). The
+            # last monomer is always kept so the line reaches the End marker.
+            stride = int(np.ceil(N / 2000))
+            keep = np.unique(np.r_[0:N:stride, N - 1])
+            xs, ys, zs = x[keep], y[keep], z[keep]
+            
+            ax.scatter(xs, ys, zs, c=keep, cmap='cool', s=2, alpha=0.6)
+            ax.plot(xs, ys, zs, alpha=0.2, color='white', lw=0.5)
             
             ax.scatter(x[0], y[0], z[0], color='lime', s=100, label='Start', edgecolors='black')
             ax.scatter(x[-1], y[-1], z[-1], color='red', s=100, label='End', edgecolors='black')
@@ -248,6 +266,9 @@ elif app_mode == "Polymer Simulator":
             ax.legend(facecolor='#0E1117', labelcolor='white')
             
             st.pyplot(fig)
+            # pyplot keeps every figure alive until closed; without this each
+            # rerun would leak a full 3D figure
+            plt.close(fig)
 # --- MODE 3: THE THREE-BODY PROBLEM ---
 elif app_mode == "Three-Body Gravitation":
     st.title("Three-Body Orbital Mechanics")
@@ -318,19 +339,22 @@ elif app_mode == "Three-Body Gravitation":
         import numpy as np
         v_mult = st.session_state.v_scale # Grab the velocity multiplier from the slider
         
+        rng = np.random.default_rng()
         for i in range(3):
             # Masses: Strictly positive (0.5 to 2.5)
-            st.session_state[f"m_{i}"] = float(np.random.uniform(0.5, 2.5))
+            st.session_state[f"m_{i}"] = float(rng.uniform(0.5, 2.5))
             
             # Positions: Between -2.0 and 2.0
-            st.session_state[f"x_{i}"] = float(np.random.uniform(-2.0, 2.0))
-            st.session_state[f"y_{i}"] = float(np.random.uniform(-2.0, 2.0))
-            st.session_state[f"z_{i}"] = float(np.random.uniform(-2.0, 2.0))
+            x, y, z = rng.uniform(-2.0, 2.0, size=3)
+            st.session_state[f"x_{i}"] = float(x)
+            st.session_state[f"y_{i}"] = float(y)
+            st.session_state[f"z_{i}"] = float(z)
             
             # Velocities: Slower to prevent instant ejections (-0.1 to 0.1)
-            st.session_state[f"vx_{i}"] = float(np.random.uniform(-0.1, 0.1)) * v_mult
-            st.session_state[f"vy_{i}"] = float(np.random.uniform(-0.1, 0.1)) * v_mult
-            st.session_state[f"vz_{i}"] = float(np.random.uniform(-0.1, 0.1)) * v_mult
+            vx, vy, vz = rng.uniform(-0.1, 0.1, size=3) * v_mult
+            st.session_state[f"vx_{i}"] = float(vx)
+            st.session_state[f"vy_{i}"] = float(vy)
+            st.session_state[f"vz_{i}"] = float(vz)
     def adjust_v_plus():
         st.session_state.v_scale = round(min(2.0, st.session_state.v_scale + 0.01), 2)
 
@@ -0,0 +1,63 @@
+import numpy as np
+import cupy as cp
+
+# CuPy alone isn't enough: fail the import (so fractal.py falls back to the
+# CPU kernel) unless a CUDA device is actually usable.
+try:
+    _HAS_DEVICE = cp.cuda.runtime.getDeviceCount() > 0
+except cp.cuda.runtime.CUDARuntimeError:
+    _HAS_DEVICE = False
+if not _HAS_DEVICE:
+    raise ImportError("CuPy is installed but no CUDA device is available")
+
+# One CUDA thread per pixel; same iteration and escape convention as the
+# Numba kernel in _fractal_numba.py.
+_mandel_kernel = cp.RawKernel(r'''
+extern "C" __global__
+void mandel(const double xmin, const double ymin, const double dx, const double dy,
+            const int width, const int height, const int max_iter, int* out)
+{
+    int i = blockIdx.x * blockDim.x + threadIdx.x;
+    int j = blockIdx.y * blockDim.y + threadIdx.y;
+    if (i >= width || j >= height) return;
+
+    double cr = xmin + i * dx;
+    double ci = ymin + j * dy;
+    double zr = 0.0, zi = 0.0;
+    int k = max_iter;
+    for (int it = 0; it < max_iter; it++) {
+        double zr2 = zr * zr, zi2 = zi * zi;
+        zi = 2.0 * zr * zi + ci;
+        zr = zr2 - zi2 + cr;
+        if (zr * zr + zi * zi > 4.0) { k = it; break; }
+    }
+    out[j * width + i] = k;
+}
+''', 'mandel')
+
+_BLOCK = (16, 16, 1)
+
+
+def _mandel_cuda(xmin, xmax, ymin, ymax, width, height, max_iter, dtype=np.int32):
+    """Runs the escape-time kernel on the GPU and returns a host array (height, width) of `dtype`."""
+    # Same grid spacing as np.linspace(xmin, xmax, width)
+    dx = (xmax - xmin) / (width - 1) if width > 1 else 0.0
+    dy = (ymax - ymin) / (height - 1) if height > 1 else 0.0
+
+    out = cp.empty((height, width), dtype=cp.int32)
+    grid = ((width + _BLOCK[0] - 1) // _BLOCK[0], (height + _BLOCK[1] - 1) // _BLOCK[1], 1)
+    _mandel_kernel(grid, _BLOCK, (
+        np.float64(xmin), np.float64(ymin), np.float64(dx), np.float64(dy),
+        np.int32(width), np.int32(height), np.int32(max_iter), out
+    ))
+    # Narrow on the device so the host transfer only moves `dtype`-sized counts
+    return out.astype(dtype, copy=False).get()
+
+
+# RawKernel compiles lazily on first launch. Launch it once here so NVRTC,
+# driver or launch errors also fail the import (and fractal.py falls back to
+# the CPU kernel) instead of surfacing mid-render.
+try:
+    _mandel_cuda(-2.0, 1.0, -1.5, 1.5, 2, 2, 1)
+except Exception as exc:
+    raise ImportError(f"CUDA Mandelbrot kernel failed to compile or launch: {exc}") from exc
@@ -0,0 +1,42 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mandel(xmin, xmax, ymin, ymax, width, height, max_iter, out):
+    """
+    Escape-time kernel for the Mandelbrot set, written into `out` (height, width).
+
+    Each pixel is iterated independently with z held in two scalar registers,
+    so the whole z = z^2 + c loop runs in a single pass with no temporaries.
+    Pixels that never escape keep the value max_iter.
+    """
+    # Same grid spacing as np.linspace(xmin, xmax, width)
+    dx = (xmax - xmin) / (width - 1) if width > 1 else 0.0
+    dy = (ymax - ymin) / (height - 1) if height > 1 else 0.0
+
+    for j in prange(height):
+        ci = ymin + j * dy
+        for i in range(width):
+            cr = xmin + i * dx
+            zr = 0.0
+            zi = 0.0
+            k = max_iter
+            for it in range(max_iter):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                zi = 2.0 * zr * zi + ci
+                zr = zr2 - zi2 + cr
+                if zr * zr + zi * zi > 4.0:
+                    k = it
+                    break
+            out[j, i] = k
+
+
+# Warm up once at import so the first click doesn't pay the compile cost
+# (with cache=True later sessions load the compiled kernel from disk).
+# generate_mandelbrot passes int16 or int32 buffers depending on max_iter,
+# so compile both.
+for _dtype in (np.int16, np.int32):
+    _mandel(-2.0, 1.0, -1.5, 1.5, 2, 2, 1, np.empty((2, 2), dtype=_dtype))
+del _dtype
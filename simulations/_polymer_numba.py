@@ -0,0 +1,192 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernel runs as plain Python (same algorithm, just slower)
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Solvent codes (the kernel can't compare the UI strings)
+SOLVENT_THETA = 0
+SOLVENT_GOOD = 1
+SOLVENT_BAD = 2
+
+# Adaptive SAW retry cap: MIN_RETRIES / (recent acceptance rate), clipped to
+# [MIN_RETRIES, MAX_RETRIES], with the rate measured over ACCEPT_WINDOW steps.
+# The rate stays near 1 for most chains, so the floor is what most crowded
+# steps get; it is kept well above the old fixed 50 so that giving up (and
+# keeping an overlapping monomer) stays rarer than before.
+MIN_RETRIES = 128
+MAX_RETRIES = 256
+ACCEPT_WINDOW = 32
+
+
+@njit(cache=True)
+def _cell_hash(kx, ky, kz, table_mask):
+    """Hashes integer cell coordinates into the spatial hash table."""
+    return ((kx * 73856093) ^ (ky * 19349663) ^ (kz * 83492791)) & table_mask
+
+
+@njit(cache=True, fastmath=True)
+def _collides(px, py, pz, coords, cell_head, cell_next, cell_size, table_mask, min_dist_sq):
+    """
+    True if any stored monomer lies closer than sqrt(min_dist_sq) to (px, py, pz).
+    With cell_size equal to that distance only the 27 surrounding cells can
+    hold a hit, so the check is O(1) instead of a scan over the whole chain.
+    """
+    kx = int(np.floor(px / cell_size))
+    ky = int(np.floor(py / cell_size))
+    kz = int(np.floor(pz / cell_size))
+    for ox in range(-1, 2):
+        for oy in range(-1, 2):
+            for oz in range(-1, 2):
+                k = cell_head[_cell_hash(kx + ox, ky + oy, kz + oz, table_mask)]
+                while k != -1:
+                    ddx = coords[k, 0] - px
+                    ddy = coords[k, 1] - py
+                    ddz = coords[k, 2] - pz
+                    if ddx * ddx + ddy * ddy + ddz * ddz < min_dist_sq:
+                        return True
+                    k = cell_next[k]
+    return False
+
+
+@njit(cache=True)
+def _cell_insert(k, coords, cell_head, cell_next, cell_size, table_mask):
+    """Pushes monomer k onto the linked list of its spatial hash cell."""
+    h = _cell_hash(int(np.floor(coords[k, 0] / cell_size)),
+                   int(np.floor(coords[k, 1] / cell_size)),
+                   int(np.floor(coords[k, 2] / cell_size)), table_mask)
+    cell_next[k] = cell_head[h]
+    cell_head[h] = k
+
+
+@njit(cache=True, fastmath=True)
+def _generate_polymer_nb(coords, start, step_size, solvent_code, use_saw, stiffness, attraction, lookback,
+                         scaling, step_pool, cell_head, cell_next, attempts_hist, accepts_hist):
+    """
+    Compiled body of polymer.generate_polymer (see there for the physics).
+
+    Grows the chain in place in `coords` (N, 3) from monomer `start` onwards,
+    taking random base steps from `step_pool` (M, 3) in order. Returns the
+    index of the first monomer it could not place because the pool can't
+    cover that step's retry cap (N once the chain is complete), so the caller
+    can draw a fresh pool and resume. The spatial hash tables and the
+    acceptance history are passed in so they carry over between calls.
+    """
+    N = coords.shape[0]
+    n_pool = step_pool.shape[0]
+    cursor = 0
+
+    cell_size = step_size * 0.8
+    min_dist_sq = cell_size ** 2
+    table_mask = cell_head.shape[0] - 1
+    if use_saw and start == 1:
+        _cell_insert(0, coords, cell_head, cell_next, cell_size, table_mask)
+
+    # Rolling sums over the last `lookback` accepted monomers (Bad Solvent core),
+    # rebuilt from the stored chain on every (re)entry
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_z = 0.0
+    for k in range(max(0, start - lookback), start):
+        sum_x += coords[k, 0]
+        sum_y += coords[k, 1]
+        sum_z += coords[k, 2]
+
+    # Attempts / successes over the last ACCEPT_WINDOW steps (ring buffers)
+    total_attempts = attempts_hist.sum()
+    total_accepts = accepts_hist.sum()
+
+    for i in range(start, N):
+        # Attempt to find a valid step (SAW logic): few retries while steps are
+        # easy, more once the chain is crowded and collisions become frequent
+        max_retries = 1
+        if use_saw:
+            accept_rate = max(total_accepts / total_attempts, 0.05)
+            max_retries = int(min(max(MIN_RETRIES / accept_rate, MIN_RETRIES), MAX_RETRIES))
+        if cursor + max_retries > n_pool:
+            return i
+
+        prev_x, prev_y, prev_z = coords[i-1, 0], coords[i-1, 1], coords[i-1, 2]
+        best_x, best_y, best_z = prev_x, prev_y, prev_z
+
+        # Solvent Physics bias. It doesn't depend on the random direction, so it
+        # is computed once per step instead of once per retry. bond_len > 0
+        # means the biased step gets renormalized to that length.
+        bias_x = 0.0
+        bias_y = 0.0
+        bias_z = 0.0
+        bond_len = 0.0
+        if solvent_code == SOLVENT_GOOD and i > 1:
+            # Geometric stiffness (persist direction), keeping bond length 'b'
+            bias_x = (prev_x - coords[i-2, 0]) * stiffness
+            bias_y = (prev_y - coords[i-2, 1]) * stiffness
+            bias_z = (prev_z - coords[i-2, 2]) * stiffness
+            bond_len = step_size
+        elif solvent_code == SOLVENT_BAD and i > lookback:
+            # Local attraction (clumping) towards the last `lookback` monomers
+            bias_x = (sum_x / lookback - prev_x) * attraction
+            bias_y = (sum_y / lookback - prev_y) * attraction
+            bias_z = (sum_z / lookback - prev_z) * attraction
+            bond_len = step_size * scaling
+
+        accepted = not use_saw
+        attempts = 0
+        while attempts < max_retries:
+            # 1. Base Step (Random Direction) + 2. Solvent bias
+            dx = step_pool[cursor, 0] + bias_x
+            dy = step_pool[cursor, 1] + bias_y
+            dz = step_pool[cursor, 2] + bias_z
+            cursor += 1
+            attempts += 1
+
+            if bond_len > 0:
+                # Renormalize
+                current_len = np.sqrt(dx * dx + dy * dy + dz * dz)
+                if current_len > 0:
+                    dx = (dx / current_len) * bond_len
+                    dy = (dy / current_len) * bond_len
+                    dz = (dz / current_len) * bond_len
+
+            # 3. Candidate Position
+            best_x = prev_x + dx
+            best_y = prev_y + dy
+            best_z = prev_z + dz
+
+            # 4. SAW Check (Excluded Volume) against all previous atoms
+            if use_saw:
+                if not _collides(best_x, best_y, best_z, coords,
+                                 cell_head, cell_next, cell_size, table_mask, min_dist_sq):
+                    accepted = True
+                    break # Success!
+
+        coords[i, 0], coords[i, 1], coords[i, 2] = best_x, best_y, best_z
+        if use_saw:
+            _cell_insert(i, coords, cell_head, cell_next, cell_size, table_mask)
+
+        # Slide the window: add the new monomer, drop the one that fell out
+        sum_x += coords[i, 0]
+        sum_y += coords[i, 1]
+        sum_z += coords[i, 2]
+        if i >= lookback:
+            sum_x -= coords[i - lookback, 0]
+            sum_y -= coords[i - lookback, 1]
+            sum_z -= coords[i - lookback, 2]
+
+        # Record this step in the acceptance history
+        h = i % ACCEPT_WINDOW
+        total_attempts += attempts - attempts_hist[h]
+        total_accepts += int(accepted) - accepts_hist[h]
+        attempts_hist[h] = attempts
+        accepts_hist[h] = int(accepted)
+
+    return N
+
+
+# Warm up once at import so the first synthesis doesn't pay the compile cost
+_generate_polymer_nb(np.zeros((2, 3), dtype=np.float32), 1, 1.0, SOLVENT_THETA, False, 1.0, 0.2, 100, 1.0,
+                     np.zeros((1, 3), dtype=np.float32), np.full(4, -1, dtype=np.int64),
+                     np.full(2, -1, dtype=np.int64), np.ones(ACCEPT_WINDOW, dtype=np.int64),
+                     np.ones(ACCEPT_WINDOW, dtype=np.int64))
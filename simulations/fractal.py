@@ -1,33 +1,141 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 
+# Optional CUDA kernel (needs cupy and a GPU), then the Numba JIT kernel.
+# Falls back to pure NumPy if neither is available.
+def _backend_missing(exc, packages):
+    """True if an ImportError means the optional backend isn't installed or usable."""
+    # The backend modules raise a bare ImportError (name=None) themselves when
+    # e.g. no GPU is present. Anything else, such as `simulations` not being
+    # importable because this file was run as a plain script, is a real error.
+    return exc.name is None or exc.name.split(".")[0] in packages
+
+try:
+    from simulations._fractal_cuda import _mandel_cuda
+except ImportError as exc:
+    if not _backend_missing(exc, ("cupy", "cupy_backends")):
+        raise
+    _mandel_cuda = None
+
+try:
+    from simulations._fractal_numba import _mandel
+except ImportError as exc:
+    if not _backend_missing(exc, ("numba", "llvmlite")):
+        raise
+    _mandel = None
+
 def get_color_map(cmap_name):
     """Returns a matplotlib colormap object."""
     return plt.get_cmap(cmap_name)
 
+# uint8 RGBA lookup tables, sampled from each colormap once per process
+_COLOR_LUTS = {}
+
+def get_color_lut(cmap_name, n=1024):
+    """Returns an (n, 4) uint8 RGBA lookup table sampled from a matplotlib colormap."""
+    key = (cmap_name, n)
+    if key not in _COLOR_LUTS:
+        _COLOR_LUTS[key] = get_color_map(cmap_name)(np.linspace(0.0, 1.0, n), bytes=True)
+    return _COLOR_LUTS[key]
+
+def colorize(div_time, max_iter, cmap_name):
+    """Maps escape counts (0..max_iter) to a uint8 RGBA image with a single LUT gather."""
+    lut = get_color_lut(cmap_name)
+    top = len(lut) - 1
+    idx = np.multiply(div_time, top / max_iter, dtype=np.float32).astype(np.int32)
+    np.clip(idx, 0, top, out=idx)
+    return lut[idx]
+
+def _count_dtype(max_iter):
+    """Smallest integer dtype that can hold escape counts up to max_iter."""
+    return np.int16 if max_iter <= np.iinfo(np.int16).max else np.int32
+
 def generate_mandelbrot(xmin, xmax, ymin, ymax, width, height, max_iter):
+    if _mandel_cuda is not None:
+        return _mandel_cuda(xmin, xmax, ymin, ymax, width, height, max_iter, _count_dtype(max_iter))
+
+    if _mandel is not None:
+        div_time = np.empty((height, width), dtype=_count_dtype(max_iter))
+        _mandel(xmin, xmax, ymin, ymax, width, height, max_iter, div_time)
+        return div_time
+
+    return _generate_mandelbrot_numpy(xmin, xmax, ymin, ymax, width, height, max_iter)
+
+# How often (in iterations) the NumPy path drops escaped pixels from its working set
+_COMPACT_EVERY = 16
+
+def _generate_mandelbrot_numpy(xmin, xmax, ymin, ymax, width, height, max_iter):
     x = np.linspace(xmin, xmax, width)
     y = np.linspace(ymin, ymax, height)
-    X, Y = np.meshgrid(x, y)
-    C = X + 1j * Y
-    Z = np.zeros_like(C)
-    
+
+    # Rows are independent, so split the image into one horizontal strip per
+    # core. NumPy releases the GIL inside its array kernels, so plain threads
+    # run the strips in parallel.
+    strips = np.array_split(y, min(os.cpu_count() or 1, height))
+    if len(strips) == 1:
+        return _mandelbrot_strip_numpy(x, y, max_iter)
+
+    with ThreadPoolExecutor(max_workers=len(strips)) as pool:
+        parts = pool.map(lambda y_strip: _mandelbrot_strip_numpy(x, y_strip, max_iter), strips)
+        return np.vstack(list(parts))
+
+def _mandelbrot_strip_numpy(x, y, max_iter):
+    width, height = len(x), len(y)
+    n = width * height
+
     # CRITICAL FIX: Initialize with max_iter (Light color)
     # This ensures the "Inside" of the set is visible against the background.
-    div_time = np.zeros(Z.shape, dtype=int) + max_iter
-
-    mask = np.ones(Z.shape, dtype=bool)
-
-    for i in range(max_iter):
-        Z[mask] = Z[mask]**2 + C[mask]
-        diverged = np.abs(Z) > 2
-        
-        # Overwrite "Outside" points with low numbers (Dark color)
-        div_time[mask & diverged] = i
-        
-        mask[diverged] = False
-        if not np.any(mask):
-            break
+    div_time = np.full(n, max_iter, dtype=_count_dtype(max_iter))
+
+    # Packed 1-D working set: flat pixel index plus c and z for every pixel
+    # that hasn't escaped yet. Compacting it shrinks the work per iteration.
+    # c is laid out row-major straight from the 1-D axes (one allocation per
+    # part, no intermediate 2-D grids).
+    idx = np.arange(n, dtype=np.int32)
+    cr = np.tile(x, height)
+    ci = np.repeat(y, width)
+    zr = np.zeros(n)
+    zi = np.zeros(n)
+    live = np.ones(n, dtype=bool)
+
+    # Escaped pixels keep iterating (and may overflow) until the next compaction
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            zr2 = zr * zr
+            zi2 = zi * zi
+            # z^2 + c = (zr^2 - zi^2 + cr) + i(2*zr*zi + ci), updated in place
+            zi *= zr
+            zi *= 2.0
+            zi += ci
+            zr2 -= zi2
+            zr2 += cr
+            zr = zr2
+
+            # |z|^2 > 4 is the same test as |z| > 2 without the square root
+            diverged = live & (zr * zr + zi * zi > 4.0)
+
+            # Overwrite "Outside" points with low numbers (Dark color)
+            div_time[idx[diverged]] = i
+
+            live[diverged] = False
+            if not live.any():
+                break
+
+            if i % _COMPACT_EVERY == _COMPACT_EVERY - 1:
+                keep = np.flatnonzero(live)
+                idx, cr, ci, zr, zi = idx[keep], cr[keep], ci[keep], zr[keep], zi[keep]
+                live = np.ones(keep.size, dtype=bool)
             
-    return div_time
\ No newline at end of file
+    return div_time.reshape(height, width)
+
+if __name__ == "__main__":
+    # Standalone render: python -m simulations.fractal (from the repo root)
+    # Uses the same compiled kernel as the app (cached on disk after the first
+    # run) and writes the pixels directly, without a Figure round trip.
+    max_iter = 100
+    div_time = generate_mandelbrot(-2.0, 0.5, -1.2, 1.2, 1000, 1000, max_iter)
+    plt.imsave("mandelbrot.png", colorize(div_time, max_iter, "inferno"), origin="lower")
@@ -1,6 +1,33 @@
 import numpy as np
 
-def generate_polymer(N, step_size, solvent_type, use_saw):
+from simulations._polymer_numba import (
+    _generate_polymer_nb, SOLVENT_THETA, SOLVENT_GOOD, SOLVENT_BAD,
+    MAX_RETRIES, ACCEPT_WINDOW
+)
+
+_SOLVENT_CODES = {
+    "Theta Solvent (Ideal)": SOLVENT_THETA,
+    "Good Solvent (Swollen)": SOLVENT_GOOD,
+    "Bad Solvent (Collapsed)": SOLVENT_BAD,
+}
+
+def _draw_steps(rng, n, step_len):
+    """
+    Draws n random base steps of length step_len as an (n, 3) float32 array.
+    Angles are drawn in one vectorized call per pool and turned into steps
+    with vectorized trig; float32 keeps that cheap and is plenty for a bond vector.
+    """
+    theta = rng.random(n, dtype=np.float32) * (2*np.pi)
+    phi = rng.random(n, dtype=np.float32) * np.pi
+
+    sin_phi = np.sin(phi)
+    steps = np.empty((n, 3), dtype=np.float32)
+    steps[:, 0] = step_len * sin_phi * np.cos(theta)
+    steps[:, 1] = step_len * sin_phi * np.sin(theta)
+    steps[:, 2] = step_len * np.cos(phi)
+    return steps
+
+def generate_polymer(N, step_size, solvent_type, use_saw, seed=None, rng=None):
     """
     Generates a 3D Random Walk simulating a polymer chain.
     
@@ -9,20 +36,18 @@ def generate_polymer(N, step_size, solvent_type, use_saw):
         step_size (float): The Kuhn Length (bond length).
         solvent_type (str): "Good", "Bad", or "Theta" (determines physics).
         use_saw (bool): If True, prevents chain crossing (Self-Avoiding Walk).
+        seed (int, optional): RNG seed; the same seed reproduces the same chain.
+        rng (np.random.Generator, optional): Generator to draw from instead of
+            seeding a new one (e.g. to share a stream across several chains).
         
     Returns:
-        x, y, z (np.arrays): Coordinates of the chain.
+        coords (np.ndarray): (N, 3) float32 array of monomer positions.
     """
     # Physics Constants
     STIFFNESS  = 1.0   # Good Solvent: Strength of forward bias
     ATTRACTION = 0.2   # Bad Solvent: Strength of pull towards core
     LOOKBACK   = 100   # Bad Solvent: How many steps back to check for the core
     
-    # Initialize arrays
-    x = np.zeros(N)
-    y = np.zeros(N)
-    z = np.zeros(N)
-    
     # Solvent Scaling (Global contraction for bad solvents)
     scaling = 1.0
     if solvent_type == "Good Solvent (Swollen)":
@@ -30,87 +55,57 @@ def generate_polymer(N, step_size, solvent_type, use_saw):
     elif solvent_type == "Bad Solvent (Collapsed)":
         scaling = 0.8 
 
-    for i in range(1, N):
-        # Attempt to find a valid step (SAW logic)
-        max_retries = 50 if use_saw else 1
-        best_x, best_y, best_z = x[i-1], y[i-1], z[i-1]
-        
-        for attempt in range(max_retries):
-            # 1. Base Step (Random Direction)
-            theta = np.random.uniform(0, 2*np.pi)
-            phi = np.random.uniform(0, np.pi)
-            
-            dx = step_size * np.sin(phi) * np.cos(theta) * scaling
-            dy = step_size * np.sin(phi) * np.sin(theta) * scaling
-            dz = step_size * np.cos(phi) * scaling
-            
-            # 2. Apply Solvent Physics
-            if solvent_type == "Good Solvent (Swollen)" and i > 1:
-                # Geometric stiffness (persist direction)
-                prev_dx = x[i-1] - x[i-2]
-                prev_dy = y[i-1] - y[i-2]
-                prev_dz = z[i-1] - z[i-2]
-                
-                dx += prev_dx * STIFFNESS
-                dy += prev_dy * STIFFNESS
-                dz += prev_dz * STIFFNESS
-                
-                # Renormalize to maintain bond length 'b'
-                current_len = np.sqrt(dx**2 + dy**2 + dz**2)
-                dx = (dx / current_len) * step_size
-                dy = (dy / current_len) * step_size
-                dz = (dz / current_len) * step_size
+    solvent_code = _SOLVENT_CODES.get(solvent_type, SOLVENT_THETA)
 
-            elif solvent_type == "Bad Solvent (Collapsed)" and i > LOOKBACK:
-                # Local attraction (clumping)
-                start_node = max(0, i - LOOKBACK)
-                local_cm_x = np.mean(x[start_node:i])
-                local_cm_y = np.mean(y[start_node:i])
-                local_cm_z = np.mean(z[start_node:i])
-                
-                dx += (local_cm_x - x[i-1]) * ATTRACTION
-                dy += (local_cm_y - y[i-1]) * ATTRACTION
-                dz += (local_cm_z - z[i-1]) * ATTRACTION
-                
-                # Renormalize
-                current_len = np.sqrt(dx**2 + dy**2 + dz**2)
-                if current_len > 0:
-                    dx = (dx / current_len) * step_size * scaling
-                    dy = (dy / current_len) * step_size * scaling
-                    dz = (dz / current_len) * step_size * scaling
+    # Monomer positions as one (N, 3) float32 block (plenty for visualization)
+    coords = np.zeros((N, 3), dtype=np.float32)
 
-            # 3. Candidate Position
-            cand_x = x[i-1] + dx
-            cand_y = y[i-1] + dy
-            cand_z = z[i-1] + dz
-            best_x, best_y, best_z = cand_x, cand_y, cand_z
+    # State the kernel carries between pool refills: the SAW spatial hash
+    # (power-of-two table of linked lists) and the recent acceptance history
+    table_size = 1 << (2 * int(N) - 1).bit_length()
+    cell_head = np.full(table_size, -1, dtype=np.int64)
+    cell_next = np.full(N, -1, dtype=np.int64)
+    attempts_hist = np.ones(ACCEPT_WINDOW, dtype=np.int64)
+    accepts_hist = np.ones(ACCEPT_WINDOW, dtype=np.int64)
 
-            # 4. SAW Check (Excluded Volume)
-            if use_saw:
-                # Check ALL previous atoms
-                dists = (x[:i] - cand_x)**2 + (y[:i] - cand_y)**2 + (z[:i] - cand_z)**2
-                if np.min(dists) >= (step_size * 0.8)**2:
-                    break # Success!
-        
-        x[i], y[i], z[i] = best_x, best_y, best_z
-        
-    return x, y, z
+    # The step loop runs in the Numba kernel. It consumes pre-drawn random
+    # steps and hands back control whenever the pool runs low; the pool is
+    # sized for the usual ~1 attempt per step plus headroom for one full retry cap.
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    i = 1
+    while i < N:
+        remaining = N - i
+        pool_size = remaining + (remaining // 4 + MAX_RETRIES if use_saw else 0)
+        step_pool = _draw_steps(rng, pool_size, step_size * scaling)
+        i = _generate_polymer_nb(
+            coords, i, float(step_size), solvent_code, bool(use_saw),
+            STIFFNESS, ATTRACTION, LOOKBACK, scaling,
+            step_pool, cell_head, cell_next, attempts_hist, accepts_hist
+        )
+    return coords
 # Add this to the bottom of simulations/polymer.py
 
-def analyze_chain(x, y, z):
+def analyze_chain(coords):
     """
-    Calculates physical properties of the polymer chain.
+    Calculates physical properties of the polymer chain from its (N, 3) coordinates.
     Returns a dictionary of metrics.
     """
+    # Metrics are accumulated in float64 even though coords are float32
+    r = coords.astype(np.float64)
+
     # 1. Center of Mass (Vector)
-    cx, cy, cz = np.mean(x), np.mean(y), np.mean(z)
+    cm = r.mean(axis=0)
+    cx, cy, cz = cm
     
     # 2. End-to-End Distance (Scalar)
-    r_end = np.sqrt((x[-1]-x[0])**2 + (y[-1]-y[0])**2 + (z[-1]-z[0])**2)
+    r_end = np.linalg.norm(r[-1] - r[0])
     
     # 3. Radius of Gyration (Scalar)
-    # Average squared distance from the Center of Mass
-    rg_sq = np.mean((x - cx)**2 + (y - cy)**2 + (z - cz)**2)
+    # Average squared distance from the Center of Mass, summed in one fused
+    # einsum pass instead of three squared temporaries
+    r -= cm
+    rg_sq = np.einsum('ij,ij->', r, r) / len(r)
     rg = np.sqrt(rg_sq)
     
     return {